@@ -13,7 +13,7 @@ from typing_extensions import Annotated, Doc
 
 from typed_argparser import ArgumentClass, ArgumentConfig, argfield
 from typed_argparser.constants import SUPPRESS
-from typed_argparser.exceptions import ArgumentError, ValidatorInitError
+from typed_argparser.exceptions import ArgumentError, ValidationError, ValidatorInitError
 
 from typed_argparser.groups import ArgumentGroup
 from typed_argparser.types import Args, UrlType
@@ -855,6 +855,23 @@ class TestRangeValidator(TestCase):
             class CLI(ArgumentClass):
                 opt1: int = argfield(validator=RangeValidator(min=10, max=5))
 
+    def test_int_zero_bound(self) -> None:
+        # A bound of 0 used to be skipped by a falsy check
+        class CLI(ArgumentClass):
+            opt1: int = argfield(validator=RangeValidator(min=0))
+
+        cli = CLI(config=config)
+        cli.parse("0")
+        self.assertEqual(cli.opt1, 0)
+
+        cli = CLI(config=config)
+        error = "cli: error: argument <OPT1>: value should be greater than 0"
+        stdout = StringIO()
+        with self.assertRaises(SystemExit) as return_code, redirect_stderr(stdout):
+            cli.parse("-1")
+        self.assertEqual(return_code.exception.code, 2)
+        self.assertEqual(get_err_msg(stdout), dedent(error))
+
 
 class TestDateTime(TestCase):
     # Test datetime types and validators
@@ -1403,6 +1420,12 @@ class TestRegexValidator(TestCase):
         self.assertEqual(return_code.exception.code, 2)
         self.assertEqual(get_err_msg(stdout), dedent(error))
 
+    def test_regex_invalid_pattern_init(self) -> None:
+        with self.assertRaisesRegex(ValidatorInitError, "RegexValidator - invalid pattern"):
+
+            class CLI(ArgumentClass):
+                opt1: str = argfield(validator=RegexValidator("[unclosed"))
+
 
 class TestConfirmationValidator(TestCase):
     def setUp(self) -> None:
@@ -1497,6 +1520,51 @@ class TestLengthValidator(TestCase):
                 opt1: str = argfield(validator=LengthValidator(min=10, max=5))
 
 
+class TestValidateMany(TestCase):
+    def test_validate_many_empty_batch(self) -> None:
+        RangeValidator(min=10, max=20).validate_many([])
+        LengthValidator(min=5).validate_many([])
+
+    def test_validate_many_out_of_range_element(self) -> None:
+        validator = RangeValidator(min=10, max=20)
+        validator.validate_many([10, 15, 20])
+        with self.assertRaisesRegex(ValidationError, "value should be between 10 and 20"):
+            validator.validate_many([10, 21, 15])
+
+    def test_validate_many_length(self) -> None:
+        validator = LengthValidator(min=3, max=5)
+        validator.validate_many(["foo", "fooba"])
+        with self.assertRaisesRegex(ValidationError, "string length should be between 3 and 5"):
+            validator.validate_many(["foo", "foobar"])
+
+    def test_validate_many_zero_bound(self) -> None:
+        validator = RangeValidator(min=0)
+        validator.validate_many([0, 5])
+        with self.assertRaisesRegex(ValidationError, "value should be greater than 0"):
+            validator.validate_many([3, -1, 2])
+
+
+class TestValidatorSharing(TestCase):
+    # ArgumentValidator.get returns a shared instance per (class, kwargs)
+
+    def test_shared_instance_for_identical_kwargs(self) -> None:
+        first = RangeValidator.get(min=10, max=20)
+        self.assertIs(first, RangeValidator.get(min=10, max=20))
+        self.assertIsNot(first, RangeValidator.get(min=10, max=21))
+        self.assertIsNot(first, LengthValidator.get(min=10, max=20))
+
+    def test_list_kwargs_share_an_instance(self) -> None:
+        # Lists are normalized to tuples for the cache key
+        first = UrlValidator.get(allowed_schemes=["http", "https"])
+        self.assertIs(first, UrlValidator.get(allowed_schemes=["http", "https"]))
+        self.assertIsNot(first, UrlValidator.get(allowed_schemes=["https", "http"]))
+
+    def test_unhashable_kwargs_fall_back_to_fresh_instances(self) -> None:
+        first = UrlValidator.get(allowed_schemes={"http", "https"})
+        second = UrlValidator.get(allowed_schemes={"http", "https"})
+        self.assertIsNot(first, second)
+
+
 class TestFieldValidations(TestCase):
     def test_invalid_field_name(self) -> None:
         with self.assertRaisesRegex(ArgumentError, "'_CLI__opt1' cannot have '__' in their name"):
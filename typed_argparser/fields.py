@@ -1,6 +1,6 @@
 from enum import Enum
 from pathlib import Path, PosixPath, WindowsPath
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Set, Tuple, Type, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Set, Tuple, Type, Union, cast
 
 from typing_extensions import Annotated, Doc, get_args, get_origin
 
@@ -18,6 +18,18 @@ from .validators import ArgumentValidator
 if TYPE_CHECKING:  # pragma: no cover
     from argparse import Action
 
+# Type-kind constants used to dispatch 'const'/'default'/'counter' validations
+# via a dictionary lookup instead of chained isinstance/equality checks.
+# The kind is computed once per field (in _eval_type_kind) after _type is assigned.
+_KIND_BOOL = 0
+_KIND_INT = 1
+_KIND_FLOAT = 2
+_KIND_UNION = 3
+_KIND_DICT = 4
+_KIND_TUPLE = 5
+_KIND_ARGTYPE = 6
+_KIND_OTHER = 7
+
 
 class ArgumentField:
     # Not to be used directly. An instance is created by the public function `argfield`
@@ -47,6 +59,7 @@ class ArgumentField:
         "_choices",
         "_group",
         "_processed",
+        "_type_kind",
     )
 
     def __init__(
@@ -89,6 +102,7 @@ class ArgumentField:
         self._config = ArgumentConfig()
         self.validator = validator
         self._processed = False
+        self._type_kind: Optional[int] = None
 
     def is_list(self) -> bool:
         return self._origin is list
@@ -111,6 +125,30 @@ class ArgumentField:
     def is_positional(self) -> bool:
         return not self._longopts and not self._shortopts
 
+    def _eval_type_kind(self) -> int:
+        # Compute the type-kind once and cache it. _type does not change after it is
+        # assigned in _update_argfields, so the cached value stays valid.
+        kind = self._type_kind
+        if kind is None:
+            if self._type is bool:
+                kind = _KIND_BOOL
+            elif self._type is int:
+                kind = _KIND_INT
+            elif self._type is float:
+                kind = _KIND_FLOAT
+            elif isinstance(self._type, _UnionType):
+                kind = _KIND_UNION
+            elif isinstance(self._type, _DictType):
+                kind = _KIND_DICT
+            elif isinstance(self._type, _TupleType):
+                kind = _KIND_TUPLE
+            elif issubclass(type(self._type), ArgumentType):
+                kind = _KIND_ARGTYPE
+            else:
+                kind = _KIND_OTHER
+            self._type_kind = kind
+        return kind
+
     def get_annotated_args(self, args_list: Optional[List[str]] = None) -> Dict[str, Any]:
         kwargs = {}
         if get_origin(self._raw_type) is Annotated:
@@ -335,16 +373,8 @@ class ArgumentField:
             if self.const is None:
                 raise ArgumentError("field starting with _ should have 'const' property", field=self)
         if self.const is not None:
-            if self._type is bool:
-                raise ArgumentError("'const' property is not allowed for 'bool' type", field=self)
-
-            if self.is_positional():
-                raise ArgumentError("'const' property is not allowed for 'positional' arguments", field=self)
-
-            if self._type is not type(self.const):
-                # TODO: This is a temporary condition. Remove in future and add proper validations
-                if not self.is_list() and not self.is_dict() and not self.is_union() and not self.is_tuple():
-                    raise ArgumentError("'const' must be of same type as field", field=self)
+            validator = _CONST_VALIDATORS.get(self._eval_type_kind(), _validate_const_plain)
+            validator(self)
 
         if self.const is None:
             self.const = True if self.is_union_w_boolean() else None
@@ -353,48 +383,9 @@ class ArgumentField:
         if self.default is not None and self.default != SUPPRESS:
             if self._required:
                 raise ArgumentError("'default' is invalid for 'required' fields", field=self)
-            if self._type and self.is_union():
-                try:
-                    calculated_default = self._type(self.default)
-                except Exception:
-                    raise ArgumentError(
-                        f"'default' must be a valid type from the given union {repr(self._type)}", field=self
-                    )
-                if not isinstance(self.default, type(calculated_default)):
-                    raise ArgumentError(
-                        f"'default' must be a valid type from the given union {repr(self._type)}", field=self
-                    )
-            elif self._type and self.is_dict():
-                try:
-                    calculated_default = self._type(self.default)
-                except Exception:
-                    raise ArgumentError(f"'default' must be a valid dict {repr(self._type)}", field=self)
-            elif self._type and self.is_tuple():
-                try:
-                    if self.is_list():
-                        calculated_default = [self._type(d_) for d_ in self.default]
-                    else:
-                        calculated_default = self._type(self.default)
-                except Exception:
-                    raise ArgumentError(f"'default' must be a valid tuple {repr(self._type)}", field=self)
-            elif self._type and issubclass(type(self._type), ArgumentType):
-                if not issubclass(type(self._type), type(self.default)):
-                    # pathlib.Path is special
-                    if type(self._type) is _PathType and (
-                        type(self.default) in [WindowsPath, PosixPath, _PathType, Path]
-                        or (isinstance(self.default, str) and self.default == "-")
-                    ):
-                        pass
-                    else:
-                        raise ArgumentError(
-                            f"'default' must be of same type as defined by 'type' property, '{type(self.default).__name__}' given",
-                            field=self,
-                        )
-            elif self._type and type(self.default) is not self._type and not isinstance(self.default, Enum):
-                raise ArgumentError(
-                    f"'default' must be of same type as defined by 'type' property, '{type(self.default).__name__}' given",
-                    field=self,
-                )
+            if self._type:
+                validator = _DEFAULT_VALIDATORS.get(self._eval_type_kind(), _validate_default_plain)
+                validator(self)
 
         if self._name == "help":
             self.default = SUPPRESS
@@ -421,6 +412,7 @@ class ArgumentField:
     def eval_help(self) -> None:
         if self._processed:
             return
+        cfg = self._config
         extras = []
 
         # Suppress help: do not show argument in help message
@@ -429,10 +421,10 @@ class ArgumentField:
 
         # For arguments (not subcommands), add default and type if available
         if not self.is_subcommand():
-            if self._config.show_default_in_help:
-                if (self._config.show_none_default and self.default is None) or self.default is not None:
+            if cfg.show_default_in_help:
+                if (cfg.show_none_default and self.default is None) or self.default is not None:
                     extras.append("(default: {})".format(self.default)) if self.default != SUPPRESS else None
-            if self._config.show_type_in_help and self._type:
+            if cfg.show_type_in_help and self._type:
                 types = getattr(self._type, "__name__", repr(self._type))
                 types = types.replace("%", "%%")
                 if types and types.startswith("[") and types.endswith("]"):
@@ -463,15 +455,16 @@ class ArgumentField:
         # We are using our own custom groups for grouping options, positional arguments
         # commands etc. If users have not put a particular option in any group, one will
         # be assigned below based on the type of option
+        cfg = self._config
         if self._action in [ActionsEnum.HELP, ActionsEnum.VERSION]:
-            self._group = self._config.default_miscellaneous_group_heading
+            self._group = cfg.default_miscellaneous_group_heading
         elif self._group is None:
             if self.is_subcommand():
-                self._group = self._config.default_commands_group_heading
+                self._group = cfg.default_commands_group_heading
             elif self.is_positional():
-                self._group = self._config.default_positional_group_heading
+                self._group = cfg.default_positional_group_heading
             else:
-                self._group = self._config.default_options_group_heading
+                self._group = cfg.default_options_group_heading
 
         if isinstance(self._group, str):
             self._group = arggroup(self._group, description=None)
@@ -479,9 +472,8 @@ class ArgumentField:
     def eval_counter(self) -> None:
         if self.counter is False:
             return
-        if self._type is not int and self._type is not float:
-            raise ArgumentError("field type must be 'int' or 'float' for counter fields", field=self)
-        if self.is_list() or self.is_dict() or self.is_tuple() or self.is_union():
+        kind = self._eval_type_kind()
+        if kind not in (_KIND_INT, _KIND_FLOAT) or self.is_list():
             raise ArgumentError("field type must be 'int' or 'float' for counter fields", field=self)
 
     def __repr__(self) -> str:
@@ -494,6 +486,102 @@ class ArgumentField:
         return f"{self.__class__.__name__}({fields_str})"
 
 
+# 'const'/'default' validators below are dispatched per type-kind so that each one
+# only contains the checks relevant to its kind, with no nested if-chains.
+def _validate_const_bool(field: ArgumentField) -> None:
+    raise ArgumentError("'const' property is not allowed for 'bool' type", field=field)
+
+
+def _validate_const_pseudo(field: ArgumentField) -> None:
+    # Union, dict and tuple fields skip the same-type check below as 'const' cannot
+    # be compared against these pseudo types directly
+    if field.is_positional():
+        raise ArgumentError("'const' property is not allowed for 'positional' arguments", field=field)
+
+
+def _validate_const_plain(field: ArgumentField) -> None:
+    if field.is_positional():
+        raise ArgumentError("'const' property is not allowed for 'positional' arguments", field=field)
+
+    if field._type is not type(field.const):
+        # TODO: This is a temporary condition. Remove in future and add proper validations
+        if not field.is_list():
+            raise ArgumentError("'const' must be of same type as field", field=field)
+
+
+def _validate_default_union(field: ArgumentField) -> None:
+    # eval_default only dispatches here when _type is set
+    typ = field._type
+    assert typ is not None
+    try:
+        calculated_default = typ(field.default)
+    except Exception:
+        raise ArgumentError(f"'default' must be a valid type from the given union {repr(typ)}", field=field)
+    if not isinstance(field.default, type(calculated_default)):
+        raise ArgumentError(f"'default' must be a valid type from the given union {repr(typ)}", field=field)
+
+
+def _validate_default_dict(field: ArgumentField) -> None:
+    # eval_default only dispatches here when _type is set
+    typ = field._type
+    assert typ is not None
+    try:
+        typ(field.default)
+    except Exception:
+        raise ArgumentError(f"'default' must be a valid dict {repr(typ)}", field=field)
+
+
+def _validate_default_tuple(field: ArgumentField) -> None:
+    # eval_default only dispatches here when _type is set and default is not None
+    typ = field._type
+    assert typ is not None and field.default is not None
+    try:
+        if field.is_list():
+            [typ(d_) for d_ in field.default]
+        else:
+            typ(field.default)
+    except Exception:
+        raise ArgumentError(f"'default' must be a valid tuple {repr(typ)}", field=field)
+
+
+def _validate_default_argtype(field: ArgumentField) -> None:
+    if not issubclass(type(field._type), type(field.default)):
+        # pathlib.Path is special
+        if type(field._type) is _PathType and (
+            type(field.default) in [WindowsPath, PosixPath, _PathType, Path]
+            or (isinstance(field.default, str) and field.default == "-")
+        ):
+            pass
+        else:
+            raise ArgumentError(
+                f"'default' must be of same type as defined by 'type' property, '{type(field.default).__name__}' given",
+                field=field,
+            )
+
+
+def _validate_default_plain(field: ArgumentField) -> None:
+    if type(field.default) is not field._type and not isinstance(field.default, Enum):
+        raise ArgumentError(
+            f"'default' must be of same type as defined by 'type' property, '{type(field.default).__name__}' given",
+            field=field,
+        )
+
+
+_CONST_VALIDATORS: Dict[int, Callable[[ArgumentField], None]] = {
+    _KIND_BOOL: _validate_const_bool,
+    _KIND_UNION: _validate_const_pseudo,
+    _KIND_DICT: _validate_const_pseudo,
+    _KIND_TUPLE: _validate_const_pseudo,
+}
+
+_DEFAULT_VALIDATORS: Dict[int, Callable[[ArgumentField], None]] = {
+    _KIND_UNION: _validate_default_union,
+    _KIND_DICT: _validate_default_dict,
+    _KIND_TUPLE: _validate_default_tuple,
+    _KIND_ARGTYPE: _validate_default_argtype,
+}
+
+
 def argfield(
     *opts: str,
     default: Optional[Any] = None,
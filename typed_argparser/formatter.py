@@ -1,36 +1,101 @@
 import re
+import textwrap
 from argparse import HelpFormatter, _SubParsersAction
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .constants import SUPPRESS
 
+# Compiled once at import time to avoid the per-call pattern lookup in re.sub
+_URL_RE = re.compile(r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+")
+
+
+def _clean_usage(text: str) -> str:
+    # Single left-to-right scan which replaces the regex cleanup chain previously
+    # used at the end of _format_actions_usage. It drops a space right after an
+    # opening bracket, a space right before a closing bracket, empty '[]'/'()'
+    # pairs, and unwraps '(...)' groups that contain no '|' separator.
+    out: List[str] = []
+    # Stack of open '(' groups as (index into out, group contains "|") pairs
+    paren_stack: List[Tuple[int, bool]] = []
+    i = 0
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if ch == "[" or ch == "(":
+            out.append(ch)
+            if ch == "(":
+                paren_stack.append((len(out) - 1, False))
+            if i + 1 < n and text[i + 1] == " ":
+                i += 1
+        elif ch == "]" or ch == ")":
+            if out and out[-1] == " ":
+                out.pop()
+            if out and (out[-1] == "[" or out[-1] == "("):
+                # Empty pair - drop the opening bracket and skip the closing one
+                dropped = out.pop()
+                if dropped == "(" and paren_stack and paren_stack[-1][0] == len(out):
+                    paren_stack.pop()
+            elif ch == ")" and paren_stack:
+                idx, has_pipe = paren_stack.pop()
+                if has_pipe:
+                    out.append(ch)
+                    if paren_stack:
+                        # The kept group (and its "|") is part of the enclosing group
+                        paren_stack[-1] = (paren_stack[-1][0], True)
+                else:
+                    del out[idx]
+            else:
+                out.append(ch)
+        elif ch == "|":
+            if paren_stack:
+                paren_stack[-1] = (paren_stack[-1][0], True)
+            out.append(ch)
+        else:
+            out.append(ch)
+        i += 1
+    return "".join(out).strip()
+
 
 class ArgumentFormatter(HelpFormatter):
     def __init__(self, prog: str) -> None:
         super().__init__(prog, max_help_position=200, width=110, indent_increment=0)
+        # TextWrapper instances cached per (width, indent) - TextWrapper.__init__
+        # compiles regexes, so avoid rebuilding one on every _fill_text call
+        self._wrappers: Dict[Tuple[int, str], textwrap.TextWrapper] = {}
 
     def _underline_links(self, text: str) -> str:
-        url_pattern = r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
-
-        def underline(match: Any) -> str:
-            return f"\033[4m{match.group(0)}\033[0m"
-
-        return re.sub(url_pattern, underline, text)
+        # Most help text contains no URL at all - skip the regex engine entirely
+        if "http" not in text:
+            return text
+        # A replacement string is applied entirely in C, with no Python callback per match
+        return _URL_RE.sub("\033[4m\\g<0>\033[0m", text)
 
     def _split_lines(self, text: str, width: int) -> List[str]:
-        text = text.split("\f")[0]
-        return text.splitlines()
+        # Fast path for the common single-line help string without form feeds
+        if "\f" not in text and "\n" not in text:
+            return [text]
+        return text.partition("\f")[0].splitlines()
 
     def _fill_text(self, text: str, width: int, indent: str) -> str:
-        text = text.split("\f")[0]
+        # partition returns the head without allocating a list of all segments
+        text = text.partition("\f")[0]
         text = self._underline_links(text)
-        term_char = text.rstrip()[-1]
-        if ord(term_char) == 0:
+        # Peek at the last non-whitespace character without the copy rstrip makes
+        i = len(text) - 1
+        while i >= 0 and text[i].isspace():
+            i -= 1
+        if i >= 0 and text[i] == "\x00":
             text = text[:-1]
             text = self._whitespace_matcher.sub(" ", text).strip()
-            import textwrap
-
-            return "\n" + textwrap.fill(text, width, initial_indent=indent, subsequent_indent=indent)
+            wrapper = self._wrappers.get((width, indent))
+            if wrapper is None:
+                wrapper = self._wrappers.setdefault(
+                    (width, indent),
+                    textwrap.TextWrapper(
+                        width=width, initial_indent=indent, subsequent_indent=indent, break_on_hyphens=False
+                    ),
+                )
+            return "\n" + wrapper.fill(text)
         else:
             return "".join(line.lstrip(" ").replace("\t", "    ") for line in text.splitlines(keepends=True))
 
@@ -40,34 +105,25 @@ class ArgumentFormatter(HelpFormatter):
         # find group indices and identify actions in groups
         group_actions = set()
         inserts: Dict[int, str] = {}
+        # Map each action to its position once so group lookups below are O(1)
+        # instead of a linear actions.index scan per group. id() is used to avoid
+        # triggering __eq__ on actions.
+        positions = {id(action): i for i, action in enumerate(actions)}
         for group in groups:
-            try:
-                start = actions.index(group._group_actions[0])
-            except ValueError:
+            start = positions.get(id(group._group_actions[0]))
+            if start is None:
                 continue
             else:
                 end = start + len(group._group_actions)
-                if actions[start:end] == group._group_actions:
+                if all(positions.get(id(action)) == start + i for i, action in enumerate(group._group_actions)):
                     for action in group._group_actions:
                         group_actions.add(action)
-                    if not group.required:
-                        if start in inserts:
-                            inserts[start] += " ["
-                        else:
-                            inserts[start] = "["
-                        if end in inserts:
-                            inserts[end] += "]"
-                        else:
-                            inserts[end] = "]"
-                    else:
-                        if start in inserts:
-                            inserts[start] += " ("
-                        else:
-                            inserts[start] = "("
-                        if end in inserts:
-                            inserts[end] += ")"
-                        else:
-                            inserts[end] = ")"
+                    open_char, close_char = ("[", "]") if not group.required else ("(", ")")
+                    # Single .get() probe instead of an 'in' check followed by indexing
+                    existing = inserts.get(start)
+                    inserts[start] = open_char if existing is None else existing + " " + open_char
+                    existing = inserts.get(end)
+                    inserts[end] = close_char if existing is None else existing + close_char
                     for i in range(start + 1, end):
                         inserts[i] = "|"
 
@@ -110,24 +166,25 @@ class ArgumentFormatter(HelpFormatter):
                 # add the action string to the list
                 parts.append(part)
 
-        # insert things at the necessary indices
-        for i in sorted(inserts, reverse=True):
-            parts[i:i] = [inserts[i]]
+        # insert things at the necessary indices, merging in a single pass rather
+        # than shifting the parts list once per insert
+        if inserts:
+            merged = []
+            for i, part in enumerate(parts):
+                insert = inserts.get(i)
+                if insert is not None:
+                    merged.append(insert)
+                merged.append(part)
+            insert = inserts.get(len(parts))
+            if insert is not None:
+                merged.append(insert)
+            parts = merged
 
         # join all the action items with spaces
         text = " ".join([item for item in parts if item is not None])
 
         # clean up separators for mutually exclusive groups
-        open = r"[\[(]"
-        close = r"[\])]"
-        text = re.sub(r"(%s) " % open, r"\1", text)
-        text = re.sub(r" (%s)" % close, r"\1", text)
-        text = re.sub(r"%s *%s" % (open, close), r"", text)
-        text = re.sub(r"\(([^|]*)\)", r"\1", text)
-        text = text.strip()
-
-        # return the text
-        return text
+        return _clean_usage(text)
 
     def _format_action_invocation(self, action: Any) -> str:
         if not action.option_strings:
@@ -136,10 +193,17 @@ class ArgumentFormatter(HelpFormatter):
             return metavar
         else:
             parts = []
+            # Classify each option string as short or long in a single pass
+            shortopt = False
+            longopt = False
+            for option_string in action.option_strings:
+                if option_string[:2] == "--":
+                    longopt = True
+                elif option_string[:1] == "-":
+                    shortopt = True
             # if the Optional doesn't take a value, format is:
             #    -s, --long
             if action.nargs == 0:
-                shortopt = any(option_string.count("-", 0, 2) == 1 for option_string in action.option_strings)
                 parts.extend(action.option_strings)
             # if the Optional takes a value, format is:
             #    -s, --long ARGS or
@@ -148,16 +212,14 @@ class ArgumentFormatter(HelpFormatter):
             else:
                 default = self._get_default_metavar_for_optional(action)
                 args_string = self._format_args(action, default)
-                shortopt = any(option_string.count("-", 0, 2) == 1 for option_string in action.option_strings)
-                longopt = any(option_string.count("-", 0, 2) == 2 for option_string in action.option_strings)
                 for option_string in action.option_strings:
                     if option_string.startswith("--"):
-                        parts.append("%s %s" % (option_string, args_string))
+                        parts.append(f"{option_string} {args_string}")
                     else:
                         if longopt:
-                            parts.append("%s" % (option_string))
+                            parts.append(option_string)
                         else:
-                            parts.append("%s %s" % (option_string, args_string))
+                            parts.append(f"{option_string} {args_string}")
 
             parts.insert(0, "  ") if shortopt is False else None
 
@@ -182,6 +244,9 @@ class ArgumentFormatter(HelpFormatter):
             self.items: List[Any] = []
 
         def format_help(self) -> Any:
+            # return nothing for empty sections without the indent/join round trip
+            if not self.items:
+                return ""
             # format the indented section
             if self.parent is not None:
                 self.formatter._indent()
@@ -197,7 +262,7 @@ class ArgumentFormatter(HelpFormatter):
             # add the heading if the section was non-empty
             if self.heading is not SUPPRESS and self.heading is not None:
                 current_indent = self.formatter._current_indent
-                heading = "%*s%s\n" % (current_indent, "", self.heading)
+                heading = f"{'':{current_indent}}{self.heading}\n"
             else:
                 heading = ""
 
@@ -214,25 +279,24 @@ class ArgumentFormatter(HelpFormatter):
         action_width = help_position - self._current_indent - 2
         action_header = self._format_action_invocation(action)
         is_subparser = False
-        if isinstance(action, _SubParsersAction):
+        # Exact type check - subparser actions are never subclassed here and this
+        # runs once per action on every help render
+        if type(action) is _SubParsersAction:
             is_subparser = True
             action.help = None
 
         # no help; start on same line and add a final newline
         if not action.help:
-            tup: Any = self._current_indent, "", action_header
-            action_header = "%*s%s\n" % tup
+            action_header = f"{'':{self._current_indent}}{action_header}\n"
 
         # short action name; start on the same line and pad two spaces
         elif len(action_header) <= action_width:
-            tup = self._current_indent, "", action_width, action_header
-            action_header = "%*s%-*s  " % tup
+            action_header = f"{'':{self._current_indent}}{action_header:<{action_width}}  "
             indent_first = 0
 
         # long action name; start on the next line
         else:
-            tup = self._current_indent, "", action_header
-            action_header = "%*s%s\n" % tup
+            action_header = f"{'':{self._current_indent}}{action_header}\n"
             indent_first = help_position
 
         # collect the pieces of the action help
@@ -245,9 +309,9 @@ class ArgumentFormatter(HelpFormatter):
         if action.help:
             help_text = self._expand_help(action)
             help_lines = self._split_lines(help_text, help_width)
-            parts.append("%*s%s\n" % (indent_first, "", help_lines[0].strip()))
+            parts.append(f"{'':{indent_first}}{help_lines[0].strip()}\n")
             for line in help_lines[1:]:
-                parts.append("%*s%s\n" % (help_position, "", line.strip()))
+                parts.append(f"{'':{help_position}}{line.strip()}\n")
 
         # or add a newline if the description doesn't end with one
         elif not action_header.endswith("\n"):
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Tuple, Union
+from weakref import WeakValueDictionary
 
 from .exceptions import ArgumentError
 
@@ -20,8 +21,9 @@ class _ArgumentGroup:
     # To create ArgumentGroups inherit ArgumentGroup class.
 
     # Maintain mapping of all instances of this class and return an
-    # existing instance if it exists, else create new one.
-    _instances: Dict[str, "_ArgumentGroup"] = {}
+    # existing instance if it exists, else create new one. Values are held
+    # weakly so groups no longer referenced by any parser can be collected.
+    _instances: "WeakValueDictionary[str, _ArgumentGroup]" = WeakValueDictionary()
     __slots__ = (
         "title",
         "description",
@@ -29,6 +31,8 @@ class _ArgumentGroup:
         "mutually_exclusive",
         "required",
         "_parser",
+        "_transformed_title",
+        "__weakref__",
     )
 
     def __init__(
@@ -50,6 +54,9 @@ class _ArgumentGroup:
         self._parser: Optional[
             Union[argparse._ArgumentGroup, argparse._MutuallyExclusiveGroup, argparse.ArgumentParser]
         ] = None
+        # Cached (heading_transform, transformed title) pair used while rendering
+        # help. Keyed on the transform so a different config recomputes it.
+        self._transformed_title: Optional[Tuple[Any, str]] = None
 
     @classmethod
     def get_instance(
@@ -61,9 +68,8 @@ class _ArgumentGroup:
         mutually_exclusive: bool = False,
         required: bool = False,
     ) -> "_ArgumentGroup":
-        if title in cls._instances:
-            return cls._instances[title]
-        else:
+        group = cls._instances.get(title)
+        if group is None:
             group = cls(
                 title,
                 description=description,
@@ -72,7 +78,7 @@ class _ArgumentGroup:
                 required=required,
             )
             cls._instances[title] = group
-            return group
+        return group
 
     def __str__(self) -> str:
         return self.title
@@ -1,7 +1,6 @@
 from argparse import Action
 from argparse import ArgumentParser as DefaultArgumentParser
-from copy import deepcopy
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, cast
 
 from .constants import SUBPARSER_TITLE, GroupTypeEnum
 from .formatter import ArgumentFormatter
@@ -29,11 +28,11 @@ class BooleanOptionalAction(Action):
         help: Optional[str] = None,
         metavar: Optional[str] = None,
     ) -> None:
-        _option_strings = []
+        _option_strings: List[str] = []
         for option_string in option_strings:
-            _option_strings.append(option_string)
             if option_string.startswith("--"):
-                option_string = "--[no-]" + option_string[2:]
+                _option_strings.extend((option_string, "--[no-]" + option_string[2:]))
+            else:
                 _option_strings.append(option_string)
 
         super().__init__(
@@ -58,6 +57,17 @@ class BooleanOptionalAction(Action):
         return " | ".join(self.option_strings)
 
 
+class _GroupView:
+    # Lightweight stand-in for the subparser action group used while rendering
+    # help. The formatter only reads 'title' and '_group_actions', so there is no
+    # need to deepcopy the real group (which would walk every sub-parser).
+    __slots__ = ("title", "_group_actions")
+
+    def __init__(self, title: Optional[str], group_actions: List[Any]) -> None:
+        self.title = title
+        self._group_actions = group_actions
+
+
 class ArgumentParser(DefaultArgumentParser):
     # Override certain methods of argparse.ArgumentParser with some sensible defaults
     def __init__(
@@ -80,6 +90,19 @@ class ArgumentParser(DefaultArgumentParser):
             add_help=False,
             allow_abbrev=True,
         )
+        self._cached_formatter: Optional[ArgumentFormatter] = None
+        # title -> action group map, rebuilt once per format_help call and used by
+        # _extract_group_actions in place of linear scans over _action_groups
+        self._group_by_title: Dict[Optional[str], "DefaultArgumentGroup"] = {}
+        self._subparser_group: Optional["DefaultArgumentGroup"] = None
+
+    def _get_formatter(self) -> ArgumentFormatter:
+        # argparse constructs a fresh formatter for every add_argument call (for
+        # metavar/help validation). Cache one instance per parser and reuse it.
+        if self._cached_formatter is None:
+            # formatter_class is fixed to ArgumentFormatter in __init__
+            self._cached_formatter = cast(ArgumentFormatter, self.formatter_class(prog=self.prog))
+        return self._cached_formatter
 
     def set_custom_argument_groups(self, groups: Dict[str, "ArgumentGroupRegistryType"] = {}) -> None:
         # Add custom groups created in ArgumentClass to ArgumentParser to be used in help formatting
@@ -99,8 +122,15 @@ class ArgumentParser(DefaultArgumentParser):
         self._action_groups.remove(self._optionals)
         self._action_groups.remove(self._positionals)
 
+    def format_usage(self) -> str:
+        # Drop the formatter cached during parser build so the render starts fresh
+        self._cached_formatter = None
+        return super().format_usage()
+
     def format_help(self) -> str:
         # Override format_help to use custom groups instead of groups created by argparse.ArgumentParser
+        # Drop the formatter cached during parser build so the render starts fresh
+        self._cached_formatter = None
         formatter = self._get_formatter()
 
         # Usage
@@ -116,15 +146,24 @@ class ArgumentParser(DefaultArgumentParser):
         formatter.add_text(self.description)
 
         # Argument groups
+        # Build the title lookup once for this render; keep the first group per
+        # title to match the previous first-match scan semantics
+        self._group_by_title = {}
+        for action_group in self._action_groups:
+            if action_group is not None and action_group.title not in self._group_by_title:
+                self._group_by_title[action_group.title] = action_group
+        self._subparser_group = self._group_by_title.get(SUBPARSER_TITLE)
+        # Resolve group actions up front and skip groups that contribute none
+        nonempty = []
         for group_details in self.groups.values():
-            group = group_details["group"]
-            group_type = group_details["group_type"]
-            action_group = self._extract_group_actions(group, group_type)
-            if action_group:
-                formatter.start_section(self.config.heading_transform(group.title) if not group.hide_title else None)
-                formatter.add_text(group.description)
-                formatter.add_arguments(action_group._group_actions)
-                formatter.end_section()
+            extracted_group = self._extract_group_actions(group_details["group"], group_details["group_type"])
+            if extracted_group and extracted_group._group_actions:
+                nonempty.append((group_details["group"], extracted_group))
+        for group, extracted_group in nonempty:
+            formatter.start_section(self._group_heading(group) if not group.hide_title else None)
+            formatter.add_text(group.description)
+            formatter.add_arguments(extracted_group._group_actions)
+            formatter.end_section()
 
         # Epilog
         formatter.add_text(self.epilog)
@@ -132,21 +171,29 @@ class ArgumentParser(DefaultArgumentParser):
         # Determine help from format above
         return formatter.format_help()
 
+    def _group_heading(self, group: "_ArgumentGroup") -> str:
+        # Group titles never change, so cache the transformed heading on the group
+        # itself; recompute only when a different heading_transform is configured
+        transform = self.config.heading_transform
+        cached = group._transformed_title
+        if cached is None or cached[0] is not transform:
+            cached = (transform, transform(group.title))
+            group._transformed_title = cached
+        return cached[1]
+
     def _extract_group_actions(
         self, group: "_ArgumentGroup", group_type: GroupTypeEnum
-    ) -> Optional["DefaultArgumentGroup"]:
+    ) -> Optional[Union["DefaultArgumentGroup", _GroupView]]:
         # This method extracts group information from argparse's action groups based on custom groups created by ArgumentClass
         # This helps in grouping of commands which was not possible in argparse.
         if group_type == GroupTypeEnum.FIELD:
-            if self._action_groups:
-                return next(filter(lambda item: item.title == group.title if item else False, self._action_groups), None)  # type: ignore[arg-type]
+            if self._group_by_title:
+                return self._group_by_title.get(group.title)
             else:  # pragma: no cover
                 return None
         else:
-            subparser_action = next(filter(lambda item: item.title == SUBPARSER_TITLE, self._action_groups), None)
+            subparser_action = self._subparser_group
             if subparser_action is None:  # pragma: no cover
                 return None
-            subparser_action_ = deepcopy(subparser_action)
-            group_actions: List = list(filter(lambda item: item.group == group.title, subparser_action._group_actions))  # type:ignore
-            subparser_action_._group_actions = group_actions
-            return subparser_action_
+            group_actions: List[Any] = [item for item in subparser_action._group_actions if item.group == group.title]  # type: ignore[attr-defined]
+            return _GroupView(subparser_action.title, group_actions)
@@ -255,10 +255,10 @@ class ArgumentClass:
             field_annotations[name] = annotation_type
 
         if self._config.add_help:
-            field_annotations["help"] = {"origin": None, "args": None, "value": None, "optional": None}
+            field_annotations["help"] = AnnotationType(None, None, None, None)
 
         if hasattr(self, _VERSION) and getattr(self, _VERSION, None):
-            field_annotations["version"] = {"origin": None, "args": None, "value": None, "optional": None}
+            field_annotations["version"] = AnnotationType(None, None, None, None)
 
         self._annotations = field_annotations
 
@@ -303,10 +303,10 @@ class ArgumentClass:
             longopts.update(field._longopts)
 
         for name, field_annotation in self._annotations.items():
-            origin = field_annotation.get("origin", None)
-            annotation = field_annotation.get("args", None)
-            value = field_annotation.get("value")
-            is_optional = field_annotation.get("optional")
+            origin = field_annotation.origin
+            annotation = field_annotation.args
+            value = field_annotation.value
+            is_optional = field_annotation.optional
 
             field = getattr(self, name, None)
             if field is None or not isinstance(field, fields.ArgumentField):  # pragma: no cover
@@ -1,23 +1,24 @@
-from _strptime import TimeRE
 from datetime import date as default_date
 from datetime import datetime as default_datetime
 from datetime import time as default_time
 from enum import Enum
-from os import fsencode
+from functools import lru_cache
 from pathlib import Path as DefaultPath
+from re import compile as re_compile
 from sys import stdin, stdout, version_info
 from typing import (  # type: ignore
     Any,
     Dict,
+    FrozenSet,
     List,
     Optional,
+    Sequence,
     Tuple,
     Union,
     _GenericAlias,
     _SpecialForm,
     cast,
 )
-from urllib.parse import urlparse
 from warnings import warn
 
 from typing_extensions import Annotated, TypeVar, get_args, get_origin
@@ -31,13 +32,89 @@ from .constants import LITERAL_TYPE, NONE_TYPE, TYPE_TYPE, UNION_TYPE
 T = TypeVar("T")
 
 
-def _is_simple_type(args: Any, exclude: List[Any] = []) -> bool:
-    for arg in args:
-        origin = get_origin(arg)
-        if origin is not None and origin not in exclude:
-            return False
-
-    return True
+@lru_cache(maxsize=1)
+def _time_re() -> Any:
+    # Shared TimeRE instance - its __init__ builds a large dict of locale
+    # regexes, so the date/time types below should not construct one per value.
+    # Built lazily because importing _strptime drags in locale and calendar,
+    # which CLIs without date/time arguments never need at startup.
+    from _strptime import TimeRE
+
+    return TimeRE()
+
+
+@lru_cache(maxsize=32)
+def _validate_strptime_format(format: str) -> None:
+    # Validate format using _strptime's TimeRE class. Cached per format string as
+    # the same format is validated for every value the parser receives.
+    try:
+        # KeyError raised when a bad format is found; can be specified as
+        # \\, in which case it was a stray % but with a space after it
+        _time_re().compile(format)
+    except KeyError as err:
+        bad_directive = err.args[0]
+        if bad_directive == "\\":  # pragma: no cover
+            bad_directive = "%"
+        del err
+        raise ArgumentError(f"'{bad_directive}' is a bad directive in format '{format}'") from None
+    # IndexError only occurs when the format string is "%"
+    except IndexError:
+        raise ArgumentError(f"stray %% in format '{format}'") from None
+
+
+_FAST_STRPTIME_DIRECTIVES = frozenset("YmdHMS")
+
+
+@lru_cache(maxsize=32)
+def _fast_strptime_pattern(format: str) -> Optional[Any]:
+    # Compiled pattern for formats that use only the common %Y %m %d %H %M %S
+    # directives; None when the format needs the full strptime machinery
+    directives = []
+    i = 0
+    n = len(format)
+    while i < n:
+        if format[i] == "%" and i + 1 < n:
+            directives.append(format[i + 1])
+            i += 2
+        else:
+            i += 1
+    if not all(directive in _FAST_STRPTIME_DIRECTIVES for directive in directives):
+        return None
+    return _time_re().compile(format)
+
+
+def _fast_strptime(value_str: str, format: str) -> Optional[Tuple[int, int, int, int, int, int]]:
+    # Fast path used by the date/time types: a single regex match plus int()
+    # conversions instead of re-parsing the format string per value in strptime.
+    # Returns None when the format is not eligible; raises ValueError (like
+    # strptime) when the value does not match the format.
+    pattern = _fast_strptime_pattern(format)
+    if pattern is None:
+        return None
+    found = pattern.match(value_str)
+    if found is None or found.end() != len(value_str):
+        raise ValueError(f"time data '{value_str}' does not match format '{format}'")
+    groups = found.groupdict()
+    return (
+        int(groups.get("Y", 1900)),
+        int(groups.get("m", 1)),
+        int(groups.get("d", 1)),
+        int(groups.get("H", 0)),
+        int(groups.get("M", 0)),
+        int(groups.get("S", 0)),
+    )
+
+
+# Immutable default for _is_simple_type - frozenset membership is O(1) when a
+# caller does pass origins to exclude
+_EMPTY_EXCLUDE: FrozenSet[Any] = frozenset()
+
+
+def _is_simple_type(args: Any, exclude: Any = _EMPTY_EXCLUDE) -> bool:
+    # Read __origin__ directly - one C-level getattr per member instead of a
+    # typing.get_origin call; equivalent for the generics this helper sees
+    # (union members are flattened, so none of them is itself a bare union)
+    return all((origin := getattr(arg, "__origin__", None)) is None or origin in exclude for arg in args)
 
 
 def _remove_none_type(types: List[Any]) -> bool:
@@ -47,19 +124,31 @@ def _remove_none_type(types: List[Any]) -> bool:
     return False
 
 
-def _get_args(annotation: Any) -> List[Any]:
+def _get_args(annotation: Any) -> Tuple[Any, ...]:
     # Using custom get_args for Union types to preserve the order of types
     # typing.get_args uses caching which doesn't necessarily return arguments
-    # in the same order in which they are defined
+    # in the same order in which they are defined.
+    # Returns the underlying (immutable) tuple - callers that need to mutate
+    # the arguments make their own list copy.
     if get_origin(annotation) is not Union:
-        return list(get_args(annotation))
+        return get_args(annotation)
     else:
-        return list(annotation.__dict__["__args__"])
+        return cast(Tuple[Any, ...], annotation.__dict__["__args__"])
+
+
+def _decompose(annotation: Any) -> Tuple[Any, Tuple[Any, ...]]:
+    # Resolve origin and arguments of an annotation exactly once. get_origin and
+    # get_args are not free, and get_types used to re-derive both several times
+    # for the same object; callers pass the pair through instead.
+    return get_origin(annotation), _get_args(annotation)
 
 
-def _get_types(annotation: Any) -> Any:
-    origin = get_origin(annotation)
-    args = list(_get_args(annotation))
+def _get_types(annotation: Any, decomposed: Optional[Tuple[Any, Any]] = None) -> Any:
+    if decomposed is None:
+        decomposed = _decompose(annotation)
+    origin, args = decomposed
+    # _remove_none_type mutates, so make a list copy of the args tuple
+    args = list(args)
     arg: Any
     if origin in UNION_TYPE:
         _remove_none_type(args)
@@ -94,7 +183,7 @@ def _get_types(annotation: Any) -> Any:
     return arg
 
 
-def _get_annotated_args(args_list: List[Any] = []) -> Dict[str, Any]:
+def _get_annotated_args(args_list: Sequence[Any] = ()) -> Dict[str, Any]:
     kwargs = {}
     args = [item for item in args_list if isinstance(item, Args)]
     for arg in args:
@@ -102,58 +191,86 @@ def _get_annotated_args(args_list: List[Any] = []) -> Dict[str, Any]:
     return kwargs
 
 
+# get_types results keyed by annotation. Annotations are immutable, so the whole
+# resolution (including the _UnionType/_DictType/_TupleType wrappers, which are
+# stateless) can be shared between fields and repeated class constructions.
+# The repr is part of the key because typing compares unions as sets
+# (Union[int, str] == Union[str, int]) while we preserve the order of union
+# arguments - see _get_args.
+_GET_TYPES_CACHE: Dict[Any, utils.AnnotationType] = {}
+
+
 def get_types(annotation: Any, parent_origin: Optional[Any] = None) -> utils.AnnotationType:
+    key = (annotation, str(annotation))
+    try:
+        cached = _GET_TYPES_CACHE.get(key)
+        cacheable = True
+    except TypeError:  # pragma: no cover
+        # Unhashable annotation metadata - resolve without caching
+        cached = None
+        cacheable = False
+    if cached is not None:
+        return cached
+    result = _resolve_types(annotation, parent_origin)
+    if cacheable:
+        _GET_TYPES_CACHE[key] = result
+    return result
+
+
+def _resolve_types(annotation: Any, parent_origin: Optional[Any] = None) -> utils.AnnotationType:
     is_optional = False
-    parent_origin = get_origin(annotation)
-    parent_args = list(_get_args(annotation))
+    parent_origin, parent_args = _decompose(annotation)
     # For Annotated fields, remove Annotated keyword and find new origin for Annotated type
     # Which is the first argument in Annotated args
     annotated_args = None
     if parent_origin is Annotated:
-        annotated_args = _get_args(annotation)[1:]
-        annotation = _get_args(annotation)[0]
-        parent_origin = get_origin(annotation)
-        parent_args = list(_get_args(annotation))
+        annotated_args = parent_args[1:]
+        annotation = parent_args[0]
+        parent_origin, parent_args = _decompose(annotation)
+
+    # Keep the annotation's own origin around - parent_origin is adjusted below
+    # for the returned AnnotationType but _get_types needs the real one
+    annotation_origin = parent_origin
 
     # For Type fields, we are not interested in the "type" of type so make origin as None
     # Eg. Type[int] or Type is same for us
     if parent_origin is type:
         annotation = parent_origin
         parent_origin = None
+        annotation_origin = None
 
+    # _remove_none_type mutates, so the union branch swaps in a list copy
+    args: Any = parent_args
     if parent_origin in UNION_TYPE:
-        is_optional = _remove_none_type(parent_args)
-        if len(parent_args) == 1:
-            parent_origin = get_origin(parent_args[0])
+        args = list(parent_args)
+        is_optional = _remove_none_type(args)
+        if len(args) == 1:
+            parent_origin = get_origin(args[0])
 
-    arg = _get_types(annotation)
+    arg = _get_types(annotation, (annotation_origin, args))
 
-    value = None
+    # Holds Enum values (a list) or Literal arguments (a tuple)
+    value: Optional[Sequence[Any]] = None
     if isinstance(arg, type) and issubclass(arg, Enum):
         value = [a.value for a in arg]
         arg = type(value[0])
 
-    if get_origin(arg) == LITERAL_TYPE:
+    arg_origin = get_origin(arg)
+    if arg_origin == LITERAL_TYPE:
         value = _get_args(arg)
         arg = type(value[0])
+        arg_origin = None
 
-    if arg is Any:
-        arg = str
-
-    if arg is TYPE_TYPE or get_origin(arg) is type:
+    if arg is TYPE_TYPE or arg_origin is type:
         arg = type
-
-    if arg is default_date:
-        arg = _DateType
-
-    if arg is default_datetime:
-        arg = _DateTimeType
-
-    if arg is default_time:
-        arg = _TimeType
-
-    if arg is DefaultPath:
-        arg = _PathType
+    else:
+        # Single lookup replacing the identity-check ladder that mapped Any and
+        # the stdlib date/time/path types to their ArgumentType counterparts
+        try:
+            arg = _TYPE_REMAP.get(arg, arg)
+        except TypeError:  # pragma: no cover
+            # Unhashable annotation - nothing to remap
+            pass
 
     # Initialise custom types with Annotated Args or without
     # any args. Going through all this trouble to have a nice
@@ -163,7 +280,7 @@ def get_types(annotation: Any, parent_origin: Optional[Any] = None) -> utils.Ann
         runtime_args = {}
         if annotated_args:
             runtime_args = _get_annotated_args(annotated_args)
-        arg = arg(**runtime_args) if runtime_args else arg()
+        arg = _make_argtype(arg, runtime_args)
 
     if (
         annotated_args
@@ -176,7 +293,7 @@ def get_types(annotation: Any, parent_origin: Optional[Any] = None) -> utils.Ann
     if isinstance(arg, (_GenericAlias, _SpecialForm)):
         raise ArgumentError(f"type '{arg}' not supported")
 
-    return {"origin": parent_origin, "args": arg, "value": value, "optional": is_optional}
+    return utils.AnnotationType(parent_origin, arg, value, is_optional)
 
 
 class Args:
@@ -196,11 +313,31 @@ class Args:
         return kwargs
 
 
+# Template ArgumentType instances shared between identical annotations. The
+# templates only carry _args/_kwargs and __call__ builds a fresh instance per
+# value, so a cached template is never mutated by parsing.
+_ARGTYPE_INSTANCE_CACHE: Dict[Tuple[type, FrozenSet[Tuple[str, Any]]], "ArgumentType"] = {}
+
+
+def _make_argtype(cls: type, runtime_args: Dict[str, Any]) -> "ArgumentType":
+    try:
+        key = (cls, frozenset(runtime_args.items()))
+    except TypeError:
+        # Unhashable runtime argument (e.g. a list of allowed url schemes)
+        return cls(**runtime_args)  # type: ignore[no-any-return]
+    instance = _ARGTYPE_INSTANCE_CACHE.get(key)
+    if instance is None:
+        instance = _ARGTYPE_INSTANCE_CACHE.setdefault(key, cls(**runtime_args))
+    return instance
+
+
 class ArgumentType:
     def __new__(cls, value_str: Optional[str] = None, *clargs: Any, **clkwargs: Any) -> "ArgumentType":
         # Class name update added here because when _new raises error, class name is not updated dynamically
-        if hasattr(cls, "help_str"):
-            help_str = cls.help_str(**clkwargs)
+        # help_str is a pure function of the runtime kwargs, so compute it once
+        # and reuse it for both the class and the instance name
+        help_str = cls.help_str(**clkwargs) if hasattr(cls, "help_str") else None
+        if help_str is not None:
             cls._update_class_name_dynamically(help_str)
 
         # new should return a tuple of args and kwargs to be sent to the super class
@@ -211,8 +348,7 @@ class ArgumentType:
             else:
                 self = super().__new__(cls, *args, **kwargs)
 
-            if hasattr(self, "help_str"):
-                help_str = self.help_str(**clkwargs)
+            if help_str is not None:
                 self._update_instance_name_dynamically(help_str)
             return self
         else:  # pragma: no cover
@@ -279,7 +415,8 @@ class _PathType(ArgumentType, DefaultPath):
         newline: Optional[str] = None,
     ) -> Any:
         mode_ = mode or self.mode
-        if fsencode(self.name) == b"-":
+        # Plain string compare - no need for an os-encoded bytes roundtrip
+        if self.name == "-":
             if any(m in mode_ for m in ["w", "a", "x"]):
                 return stdout
             else:  # pragma: no cover
@@ -305,27 +442,24 @@ class _DateType(ArgumentType, default_date):
     def new(
         cls, value_str: Optional[str] = None, format: str = "%Y-%m-%d", **__: Any
     ) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
-        # Validate format using _strptime's TimeRE class
-        try:  # pragma: no cover
-            # KeyError raised when a bad format is found; can be specified as
-            # \\, in which case it was a stray % but with a space after it
-            TimeRE().compile(format)
-        except KeyError as err:  # pragma: no cover
-            bad_directive = err.args[0]
-            if bad_directive == "\\":  # pragma: no cover
-                bad_directive = "%"
-            del err
-            raise ArgumentError(f"'{bad_directive}' is a bad directive in format '{format}'") from None
-        # IndexError only occurs when the format string is "%"
-        except IndexError:  # pragma: no cover
-            raise ArgumentError(f"stray %% in format '{format}'") from None
+        _validate_strptime_format(format)
 
         if value_str:
             try:
-                d_ = default_datetime.strptime(value_str, format).date()
+                parsed = _fast_strptime(value_str, format)
+                if parsed is not None:
+                    # Validate ranges (e.g. Feb 30) the same way strptime would
+                    default_date(parsed[0], parsed[1], parsed[2])
+                    return (parsed[0], parsed[1], parsed[2]), {}
+                # _strptime is the function datetime.strptime wraps - use it
+                # directly so no intermediate datetime/date object is built
+                from _strptime import _strptime
+
+                tt = _strptime(value_str, format)[0]
+                default_date(tt[0], tt[1], tt[2])
             except ValueError:
                 raise ValueError(f"date string '{value_str}' does not match '{format}'") from None
-            return (d_.year, d_.month, d_.day), {}
+            return (tt[0], tt[1], tt[2]), {}
         else:
             return (1900, 1, 1), {}
 
@@ -342,23 +476,15 @@ class _DateTimeType(ArgumentType, default_datetime):
     def new(
         cls, value_str: Optional[str] = None, format: str = "%Y-%m-%dT%H:%M:%S", **__: Any
     ) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
-        # Validate format using _strptime's TimeRE class
-        try:
-            # KeyError raised when a bad format is found; can be specified as
-            # \\, in which case it was a stray % but with a space after it
-            TimeRE().compile(format)
-        except KeyError as err:
-            bad_directive = err.args[0]
-            if bad_directive == "\\":  # pragma: no cover
-                bad_directive = "%"
-            del err
-            raise ArgumentError(f"'{bad_directive}' is a bad directive in format '{format}'") from None
-        # IndexError only occurs when the format string is "%"
-        except IndexError:
-            raise ArgumentError(f"stray %% in format '{format}'") from None
+        _validate_strptime_format(format)
 
         if value_str:
             try:
+                parsed = _fast_strptime(value_str, format)
+                if parsed is not None:
+                    # Validate ranges (e.g. Feb 30) the same way strptime would
+                    default_datetime(*parsed)
+                    return parsed + (0, None), {}
                 dt_ = default_datetime.strptime(value_str, format)
             except ValueError:
                 raise ValueError(f"datetime string '{value_str}' does not match '{format}'") from None
@@ -379,27 +505,25 @@ class _TimeType(ArgumentType, default_time):
     def new(
         cls, value_str: Optional[str] = None, format: str = "%H:%M:%S", **__: Any
     ) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
-        # Validate format using _strptime's TimeRE class
-        try:  # pragma: no cover
-            # KeyError raised when a bad format is found; can be specified as
-            # \\, in which case it was a stray % but with a space after it
-            TimeRE().compile(format)
-        except KeyError as err:  # pragma: no cover
-            bad_directive = err.args[0]
-            if bad_directive == "\\":  # pragma: no cover
-                bad_directive = "%"
-            del err
-            raise ArgumentError(f"'{bad_directive}' is a bad directive in format '{format}'") from None
-        # IndexError only occurs when the format string is "%"
-        except IndexError:  # pragma: no cover
-            raise ArgumentError(f"stray %% in format '{format}'") from None
+        _validate_strptime_format(format)
 
         if value_str:
             try:
-                t_ = default_datetime.strptime(value_str, format).time()
+                parsed = _fast_strptime(value_str, format)
+                if parsed is not None:
+                    # Validate ranges (e.g. leap seconds) the same way strptime would
+                    default_time(parsed[3], parsed[4], parsed[5])
+                    return (parsed[3], parsed[4], parsed[5], 0, None), {}
+                # _strptime is the function datetime.strptime wraps - use it
+                # directly so no intermediate datetime/time object is built.
+                # datetime.time() drops tzinfo, so it is always None here.
+                from _strptime import _strptime
+
+                tt, fraction, _ = _strptime(value_str, format)
+                default_time(tt[3], tt[4], tt[5])
             except ValueError:
                 raise ValueError(f"time string '{value_str}' does not match '{format}'") from None
-            return (t_.hour, t_.minute, t_.second, t_.microsecond, t_.tzinfo), {}
+            return (tt[3], tt[4], tt[5], fraction, None), {}
         else:
             return (0, 0, 0), {}
 
@@ -408,6 +532,17 @@ class _TimeType(ArgumentType, default_time):
         return f"{getattr(cls, '__type_name__','time')} [{format}]"
 
 
+# Stdlib types (and Any) remapped to their ArgumentType counterparts at the
+# end of type resolution - see _resolve_types
+_TYPE_REMAP: Dict[Any, Any] = {
+    Any: str,
+    default_date: _DateType,
+    default_datetime: _DateTimeType,
+    default_time: _TimeType,
+    DefaultPath: _PathType,
+}
+
+
 class UrlType(ArgumentType):
     __metavar__ = "url"
     __type_name__ = "Url"
@@ -419,7 +554,7 @@ class UrlType(ArgumentType):
     def __init__(
         self,
         url: Optional[str] = None,
-        allowed_schemes: List[str] = [],
+        allowed_schemes: Sequence[str] = (),
         host_required: bool = False,
         port_required: bool = False,
     ):
@@ -430,6 +565,8 @@ class UrlType(ArgumentType):
         if not isinstance(url, str):  # pragma: no cover
             raise ArgumentError(f"invalid url format '{type(url)}', str expected.")
 
+        from urllib.parse import urlparse
+
         self.url = urlparse(url)
 
         rc = utils.validate_url(
@@ -448,7 +585,7 @@ class UrlType(ArgumentType):
         self.fragment = self.url.fragment
 
     @classmethod
-    def help_str(cls, allowed_schemes: List[str] = [], **__: Any) -> str:
+    def help_str(cls, allowed_schemes: Sequence[str] = (), **__: Any) -> str:
         if allowed_schemes:
             return f"url [{'|'.join(allowed_schemes)}]"
         else:
@@ -474,11 +611,21 @@ class _TupleType:
     # Since argparse doesn't support tuples natively, we "call" this class
     # instance in _post_parse_conversion method
 
-    def __init__(self, types: List[Any] = []):
+    def __init__(self, types: Sequence[Any] = ()):
         for typ in types:
             if get_origin(typ) is not None and get_origin(typ) is not type:
                 raise ArgumentError(f"tuple types must be simple builtin types - '{getattr(typ, '__name__', repr(typ))}'")
         self.types = types
+        # Specialise the conversion once per tuple annotation instead of
+        # re-checking each position on every value: None means the element is
+        # kept as-is (Type[...] positions). For Tuple[X, ...] a single
+        # converter is reused for every element.
+        self._has_ellipsis = Ellipsis in types
+        if self._has_ellipsis:
+            typ = types[0]
+            self._converters = [None if typ is TYPE_TYPE or get_origin(typ) is type else typ]
+        else:
+            self._converters = [None if typ is TYPE_TYPE or get_origin(typ) is type else typ for typ in types]
 
     def __call__(self, value: Union[str, List[str]]) -> Any:
         if isinstance(value, str):
@@ -488,27 +635,17 @@ class _TupleType:
             return value
 
         # This is the actual conversion call from _post_parse_conversion
-        if len(value) != len(self.types) and not self.has_ellipsis():  # pragma: no cover
-            raise ValueError("tuple and value mismatch")
-        result = []
-        if not self.has_ellipsis():
-            for val, typ in zip(value, self.types):
-                if typ is TYPE_TYPE or get_origin(typ) is type:
-                    result.append(val)
-                else:
-                    result.append(typ(val))
-        else:
-            typ = self.types[0]
-            for val in value:
-                if typ is TYPE_TYPE or get_origin(typ) is type:
-                    result.append(val)
-                else:
-                    result.append(typ(val))
-
-        return tuple(result)
+        if not self._has_ellipsis:
+            if len(value) != len(self.types):  # pragma: no cover
+                raise ValueError("tuple and value mismatch")
+            return tuple(val if conv is None else conv(val) for val, conv in zip(value, self._converters))
+        conv = self._converters[0]
+        if conv is None:
+            return tuple(value)
+        return tuple(conv(val) for val in value)
 
     def has_ellipsis(self) -> bool:
-        return Ellipsis in self.types
+        return self._has_ellipsis
 
     # def __str__(self) -> str:
     #     if self.has_ellipsis():
@@ -518,13 +655,33 @@ class _TupleType:
     #     return f"<class '_TupleType[{','.join(types)}]'>"
 
     def __repr__(self) -> str:
-        if self.has_ellipsis():
+        if self._has_ellipsis:
             types = [getattr(self.types[0], "__name__", repr(self.types[0])), "..."]
         else:
             types = [getattr(t_, "__name__", repr(t_)) for t_ in self.types]
         return "({})".format(",".join(types))
 
 
+# Fast-accept predicates used by _UnionType. When a predicate matches, the
+# paired converter is guaranteed to succeed, so the common case resolves a
+# value without raising and catching an exception per non-matching type.
+_INT_MATCH = re_compile(r"[+-]?\d+\Z").match
+_FLOAT_MATCH = re_compile(r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?\Z").match
+
+_UNION_PREDICATES: Dict[Any, Any] = {int: _INT_MATCH, float: _FLOAT_MATCH, str: lambda value: True}
+
+
+def _union_int_str(value: str) -> Any:
+    # Specialised converter for the default (int, str) union - by far the most
+    # common one - that skips the generic member loop entirely
+    if type(value) is str and _INT_MATCH(value):
+        return int(value)
+    try:
+        return int(value)
+    except Exception:
+        return str(value)
+
+
 # This is a psuedo type, an object of _UnionType is not created, instead
 # just type conversion is performed in __call__ method.
 class _UnionType:
@@ -538,7 +695,7 @@ class _UnionType:
     # The order of types in union is taken into consideration for resolving values.
     # So make sure to put "str" as the last union argument else everything will
     # get resolved as string on the first match.
-    def __init__(self, types: List[Any] = [int, str]):
+    def __init__(self, types: Sequence[Any] = (int, str)):
         # For more than 1 argument, we first check if all remaining arguments are simple built-ins
         # and then return a partial union function that best evaluates the value based on this simple union
         # Ex. Union[int, str] or Union[float, int, bool] etc.
@@ -546,14 +703,24 @@ class _UnionType:
         if not _is_simple_type(types):
             raise ArgumentError(f"unions must simple builtin types - '{getattr(types, '__name__', repr(types))}'")
         self.types = types
+        # Pair each type with its fast-accept predicate (None when there is
+        # none); types without a matching predicate keep the try/except probe
+        self._converters = [(None if typ is bool else _UNION_PREDICATES.get(typ), typ) for typ in types]
+        # Dedicated converter for the default union, bypassing the loop below
+        self._specialised = _union_int_str if list(types) == [int, str] else None
 
     def __call__(self, value: str) -> Any:
-        for arg in self.types:
+        if self._specialised is not None:
+            return self._specialised(value)
+        is_str = type(value) is str
+        for pred, arg in self._converters:
             if arg is bool:
                 if value == "True" or value == "":
                     return True
                 if value == "False" or value is None:
                     return False
+            elif pred is not None and is_str and pred(value):
+                return arg(value)
             else:
                 try:
                     return arg(value)
@@ -586,7 +753,7 @@ class _DictType:
     # union of boolean.
     #
     # Dict values are resolved using _DictType.
-    def __init__(self, types: List[Any] = []):
+    def __init__(self, types: Sequence[Any] = ()):
         key_type, value_type = types
         # Only allow string and int keys for dictionary type
         if key_type not in [str, int]:
@@ -594,21 +761,28 @@ class _DictType:
         if value_type not in [str, int, float, bool, NONE_TYPE] and get_origin(value_type) not in UNION_TYPE:
             raise ArgumentError("dictionary value type must be one of 'str', 'int', 'float', 'bool', 'None' and 'Union'")
         if get_origin(value_type) in UNION_TYPE:
-            if not _is_simple_type(list(get_args(value_type))):
+            if not _is_simple_type(get_args(value_type)):
                 raise ArgumentError("unions must be simple builtin types")
         self.types = types
+        # Resolve the key/value converters once per annotation - __call__ used
+        # to re-derive the union arguments and build a fresh _UnionType for
+        # every key=value pair
+        self._key_conv = key_type
+        if get_origin(value_type) in UNION_TYPE:
+            args = list(_get_args(value_type))
+            self._val_optional = _remove_none_type(args)
+            self._val_conv: Any = _UnionType(types=args)
+            self._val_is_union = True
+        else:
+            self._val_optional = False
+            self._val_conv = value_type
+            self._val_is_union = False
 
     def _get_dict_values(self, value: str) -> Tuple[str, Optional[Union[str, bool]]]:
-        split_result = value.split("=")
-        val: Optional[Union[str, bool]]
-        if len(split_result) == 2:
-            key, val = split_result
-        elif len(split_result) == 1:
-            key = split_result[0]
+        # partition returns a fixed 3-tuple in one call - no list or len branch
+        key, sep, val = value.partition("=")
+        if sep == "":
             val = "True"
-        else:  # pragma: no cover
-            # This is not raised in testing as its caught while parsing and SystemExit raised
-            raise ValueError("invalid value for dictionary")
         if key == "":  # pragma: no cover
             # This is not raised in testing as its caught while parsing and SystemExit raised
             raise ValueError("invalid value (no key) for dictionary")
@@ -619,23 +793,18 @@ class _DictType:
             key, val = self._get_dict_values(value)
         else:
             key, val = next(iter(value.items()))
-        key_type = self.types[0]
-        val_type = self.types[1]
-        origin = get_origin(val_type)
-        args = list(_get_args(val_type))
         try:
-            key = key_type(key)
+            key = self._key_conv(key)
         except ValueError:  # pragma: no cover
             raise ArgumentError("dict key is invalid")
-        if origin in UNION_TYPE:
-            is_optional = _remove_none_type(args)
-            if is_optional and val is None:
+        if self._val_is_union:
+            if self._val_optional and val is None:
                 computed_val = None
             else:
-                computed_val = _UnionType(types=args)(cast(str, val))
+                computed_val = self._val_conv(cast(str, val))
         else:
             try:
-                computed_val = val_type(val)
+                computed_val = self._val_conv(val)
             except ValueError:
                 raise ArgumentError("dict value conversion error") from None
 
@@ -1,15 +1,17 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypedDict
-from urllib.parse import ParseResult
+from collections import namedtuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
 if TYPE_CHECKING:  # pragma: no cover
+    from urllib.parse import ParseResult
+
     from .constants import ArgumentGroupRegistryType
 
 
-class AnnotationType(TypedDict):
-    origin: Any
-    args: Any
-    value: Any
-    optional: Any
+# Resolved annotation as returned by get_types. A namedtuple rather than a
+# dict: fields are read with attribute access and instances are immutable,
+# which also lets get_types share them between identical annotations.
+AnnotationType = namedtuple("AnnotationType", ["origin", "args", "value", "optional"])
 
 
 def transform_heading(heading: str) -> str:
@@ -25,14 +27,9 @@ def qualified_name(name: str, qual: Optional[str] = None) -> str:
 
 
 def _remove_duplicates(keys: List[str]) -> List[str]:
-    # Remove duplicates without chaning the order of the list
-    seen = set()
-    updated_keys = []
-    for key in keys:
-        if key not in seen:
-            seen.add(key)
-            updated_keys.append(key)
-    return updated_keys
+    # Remove duplicates without changing the order of the list - dict.fromkeys
+    # is an order-preserving dedup done entirely in C
+    return list(dict.fromkeys(keys))
 
 
 def sort_groups(
@@ -40,13 +37,16 @@ def sort_groups(
 ) -> Dict[str, "ArgumentGroupRegistryType"]:
     if "*" not in sorting_list:
         sorting_list.append("*")
-    sorting_list = _remove_duplicates(sorting_list)
-    sorting_list = [key.lower() for key in sorting_list]
+    # Lowercase once and dedup up front; the wildcard scan below then does a
+    # set lookup per key instead of rebuilding a lowercased list per iteration
+    sorting_list = _remove_duplicates([key.lower() for key in sorting_list])
+    sorting_set = set(sorting_list)
     groups_keys = [key.lower() for key in groups.keys()]
-    wildcard_keys = [key for key in groups_keys if key.lower() not in [k.lower() for k in sorting_list]]
+    wildcard_keys = [key for key in groups_keys if key not in sorting_set]
+    groups_set = set(groups_keys)
     sorted_keys: List[str] = []
     for key in sorting_list:
-        if key not in groups_keys and key != "*":
+        if key not in groups_set and key != "*":
             continue
         sorted_keys.extend(wildcard_keys) if key == "*" else sorted_keys.append(key)
 
@@ -54,8 +54,18 @@ def sort_groups(
     return sorted_dict
 
 
+@lru_cache(maxsize=16)
+def _scheme_set(schemes: Tuple[str, ...]) -> FrozenSet[str]:
+    # Lowercased scheme set cached per allowed_schemes tuple - the same list is
+    # passed in for every value a url argument receives
+    return frozenset(scheme.lower() for scheme in schemes)
+
+
 def validate_url(
-    url_components: ParseResult, allowed_schemes: List[str] = [], host_required: bool = False, port_required: bool = False
+    url_components: "ParseResult",
+    allowed_schemes: Sequence[str] = (),
+    host_required: bool = False,
+    port_required: bool = False,
 ) -> str:
     scheme = url_components.scheme
     hostname = url_components.hostname
@@ -65,7 +75,8 @@ def validate_url(
         return "invalid url structure"
 
     if allowed_schemes:
-        if scheme not in allowed_schemes:
+        # urlparse lowercases the scheme, so compare against a lowercased set
+        if scheme.lower() not in _scheme_set(tuple(allowed_schemes)):
             return f"invalid scheme {scheme}, expected values {allowed_schemes}"
 
     if host_required:
@@ -1,12 +1,13 @@
 from datetime import date, datetime, time
-from _strptime import TimeRE
-from os import fsencode
+from functools import lru_cache
+from os import stat
 from pathlib import Path
+from stat import S_ISDIR, S_ISREG
 import re
-from typing import Any, Generic, List, Optional, Sized, TypeVar, Union
-from urllib.parse import urlparse
+from typing import Any, Dict, Generic, Iterable, Optional, Sequence, Sized, Tuple, TypeVar, Union
+from weakref import WeakValueDictionary
 
-from typed_argparser.types import _DateTimeType, _DateType
+from typed_argparser.types import _DateTimeType, _DateType, _time_re
 from typed_argparser.utils import validate_url
 
 from .exceptions import ValidationError, ValidatorInitError
@@ -14,22 +15,94 @@ from .exceptions import ValidationError, ValidatorInitError
 F = TypeVar("F")
 
 
+@lru_cache(maxsize=1024)
+def _parse_dt(value: str, format: str) -> datetime:
+    # Repeated date strings (identical bounds across validators, batch-style
+    # callers) resolve to a cache hit instead of a strptime parse
+    return datetime.strptime(value, format)
+
+
+# Value type -> (kind, default format) used by DateTimeRangeValidator; a dict
+# probe on the exact type replaces the per-call isinstance chain. datetime is
+# deliberately keyed separately from its date base class.
+_KIND_BY_TYPE = {
+    date: ("date", "%Y-%m-%d"),
+    _DateType: ("date", "%Y-%m-%d"),
+    datetime: ("datetime", "%Y-%m-%dT%H:%M:%S"),
+    _DateTimeType: ("datetime", "%Y-%m-%dT%H:%M:%S"),
+    time: ("time", "%H:%M:%S"),
+}
+
+
 class ArgumentValidator(Generic[F]):
+    # Validators are created per field configuration and hold a handful of
+    # fixed attributes, so each declares __slots__ - no per-instance __dict__.
+    # __weakref__ is needed here for the WeakValueDictionary below.
+    __slots__ = ("__weakref__",)
+
+    # Shared instances returned by get(), keyed on (class, constructor kwargs).
+    # Held weakly so validators no longer referenced by any field can be
+    # collected - same flyweight pattern as _ArgumentGroup.
+    _instances: "WeakValueDictionary[Any, ArgumentValidator[Any]]" = WeakValueDictionary()
+
     def __call__(self, value: F, **kwargs: Any) -> Any:
         # value is supplied by argument parser
         # kwargs is supplied by ArgumentClass parser as runtime arguments
         if hasattr(self, "validator"):
             return self.validator(value, **kwargs)
 
+    @classmethod
+    def get(cls, **kwargs: Any) -> "ArgumentValidator[Any]":
+        # Return a shared instance for an identical configuration - the same
+        # validator config is typically repeated across many fields. List
+        # kwargs are converted to tuples for the key only; anything else
+        # unhashable falls back to a fresh instance.
+        try:
+            key = (cls, tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in kwargs.items())))
+            instance = cls._instances.get(key)
+        except TypeError:
+            return cls(**kwargs)
+        if instance is None:
+            instance = cls(**kwargs)
+            cls._instances[key] = instance
+        return instance
+
+    def validate_many(self, values: Iterable[F], **kwargs: Any) -> None:
+        # Validate a batch of values with the method lookup hoisted out of the
+        # loop; subclasses can override with a bulk check
+        validator = getattr(self, "validator", None)
+        if validator is None:  # pragma: no cover
+            return
+        for value in values:
+            validator(value, **kwargs)
+
 
 class LengthValidator(ArgumentValidator[Sized]):
-    def validator(self, value: str) -> None:
-        if self.min and self.max and (len(value) < self.min or len(value) > self.max):
-            raise ValidationError(f"string length should be between {self.min} and {self.max}", validator=self)
-        if self.min and len(value) < self.min:
-            raise ValidationError(f"string length should be greater than {self.min}", validator=self)
-        if self.max and len(value) > self.max:
-            raise ValidationError(f"string length should be less than {self.max}", validator=self)
+    __slots__ = ("min", "max")
+
+    def validator(self, value: Sized) -> None:
+        # At most one branch runs, with len computed once. 'is not None' so a
+        # min of 0 counts as a bound.
+        length = len(value)
+        lo, hi = self.min, self.max
+        if lo is not None and hi is not None:
+            if length < lo or length > hi:
+                raise ValidationError(f"string length should be between {lo} and {hi}", validator=self)
+        elif lo is not None:
+            if length < lo:
+                raise ValidationError(f"string length should be greater than {lo}", validator=self)
+        elif hi is not None:
+            if length > hi:
+                raise ValidationError(f"string length should be less than {hi}", validator=self)
+
+    def validate_many(self, values: Iterable[Sized], **kwargs: Any) -> None:
+        # Validating the shortest and the longest element covers the whole
+        # batch in two C-level passes instead of a check per element
+        values = list(values)
+        if not values:
+            return
+        self.validator(min(values, key=len))
+        self.validator(max(values, key=len))
 
     def __init__(self, min: Optional[int] = None, max: Optional[int] = None) -> None:
         if (min and max and min >= max) or (min is None and max is None):
@@ -39,13 +112,29 @@ class LengthValidator(ArgumentValidator[Sized]):
 
 
 class RangeValidator(ArgumentValidator[Union[int, float]]):
+    __slots__ = ("min", "max")
+
     def validator(self, value: Union[int, float]) -> None:
-        if self.min and self.max and (value < self.min or value > self.max):
-            raise ValidationError(f"value should be between {self.min} and {self.max}", validator=self)
-        if self.min and value < self.min:
-            raise ValidationError(f"value should be greater than {self.min}", validator=self)
-        if self.max and value > self.max:
-            raise ValidationError(f"value should be less than {self.max}", validator=self)
+        # At most one branch runs; 'is not None' so a bound of 0 still applies
+        lo, hi = self.min, self.max
+        if lo is not None and hi is not None:
+            if value < lo or value > hi:
+                raise ValidationError(f"value should be between {lo} and {hi}", validator=self)
+        elif lo is not None:
+            if value < lo:
+                raise ValidationError(f"value should be greater than {lo}", validator=self)
+        elif hi is not None:
+            if value > hi:
+                raise ValidationError(f"value should be less than {hi}", validator=self)
+
+    def validate_many(self, values: Iterable[Union[int, float]], **kwargs: Any) -> None:
+        # Validating the extremes covers the whole batch in two C-level passes
+        # instead of a comparison pair per element
+        values = list(values)
+        if not values:
+            return
+        self.validator(min(values))
+        self.validator(max(values))
 
     def __init__(self, min: Optional[Union[int, float]] = None, max: Optional[Union[int, float]] = None):
         if (min and max and min >= max) or (min is None and max is None):
@@ -58,24 +147,45 @@ class RangeValidator(ArgumentValidator[Union[int, float]]):
 
 
 class DateTimeRangeValidator(ArgumentValidator[date]):
+    __slots__ = ("min", "max", "format", "_bounds")
+
     def validator(self, value: Union[date, datetime, time], format: str = "?") -> None:
         min_date: Any
         max_date: Any
         # No need to check format here again. It is checked by DateTime types,
         # so format will always be valid here.
         format = self.format if self.format != "?" else format
-        if type(value) is date or isinstance(value, _DateType):
-            format = "%Y-%m-%d" if format == "?" else format
-            min_date = datetime.strptime(self.min, format).date() if self.min else None
-            max_date = datetime.strptime(self.max, format).date() if self.max else None
-        elif type(value) is datetime or isinstance(value, _DateTimeType):
-            format = "%Y-%m-%dT%H:%M:%S" if format == "?" else format
-            min_date = datetime.strptime(self.min, format) if self.min else None
-            max_date = datetime.strptime(self.max, format) if self.max else None
-        else:
-            format = "%H:%M:%S" if format == "?" else format
-            min_date = datetime.strptime(self.min, format).time() if self.min else None
-            max_date = datetime.strptime(self.max, format).time() if self.max else None
+        kind_format = _KIND_BY_TYPE.get(type(value))
+        if kind_format is None:
+            # Subclass of one of the keyed types - fall back to isinstance and
+            # register the exact type so the next value of it hits the dict
+            if isinstance(value, _DateType):
+                kind_format = _KIND_BY_TYPE[date]
+            elif isinstance(value, _DateTimeType):
+                kind_format = _KIND_BY_TYPE[datetime]
+            else:
+                kind_format = _KIND_BY_TYPE[time]
+            _KIND_BY_TYPE[type(value)] = kind_format
+        kind, default_format = kind_format
+        if format == "?":
+            format = default_format
+
+        # min/max are fixed at construction but the effective format may only
+        # arrive with the value, so the strptime results are memoized per
+        # (kind, format) instead of being re-parsed for every value
+        bounds = self._bounds.get((kind, format))
+        if bounds is None:
+            if kind == "date":
+                min_date = _parse_dt(self.min, format).date() if self.min else None
+                max_date = _parse_dt(self.max, format).date() if self.max else None
+            elif kind == "datetime":
+                min_date = _parse_dt(self.min, format) if self.min else None
+                max_date = _parse_dt(self.max, format) if self.max else None
+            else:
+                min_date = _parse_dt(self.min, format).time() if self.min else None
+                max_date = _parse_dt(self.max, format).time() if self.max else None
+            bounds = self._bounds[(kind, format)] = (min_date, max_date)
+        min_date, max_date = bounds
 
         if min_date and max_date and (value < min_date or value > max_date):
             raise ValidationError(f"should be between {min_date} and {max_date}", validator=self)
@@ -89,7 +199,7 @@ class DateTimeRangeValidator(ArgumentValidator[date]):
             try:
                 # KeyError raised when a bad format is found; can be specified as
                 # \\, in which case it was a stray % but with a space after it
-                TimeRE().compile(format)
+                _time_re().compile(format)
             except KeyError as err:
                 bad_directive = err.args[0]
                 if bad_directive == "\\":  # pragma: no cover
@@ -111,29 +221,42 @@ class DateTimeRangeValidator(ArgumentValidator[date]):
         self.min = min
         self.max = max
         self.format = format
+        # (kind, format) -> (min, max) bounds parsed on first use
+        self._bounds: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
 
 
 class PathValidator(ArgumentValidator[Union[Path, str]]):
+    __slots__ = ("is_absolute", "is_dir", "is_file", "exists", "_checks")
+
     def validator(self, value: Union[Path, str]) -> None:
         if not isinstance(value, (str, Path)):
             raise ValidationError(f"expected 'str' or 'Path' value. Found '{type(value).__name__}'")
+        # Perform no validation on stdin/stdout files - a plain string compare,
+        # checked before even constructing a Path
+        if (value if isinstance(value, str) else str(value)) == "-":
+            return
         if isinstance(value, str):
             value = Path(value)
-        # Perform no validation on stdin/stdout files
-        if fsencode(value) == b"-":
-            return
-        if self.is_absolute:
-            if not value.is_absolute():
-                raise ValidationError(f"'{value}' is not an absolute path", validator=self)
-        if self.is_dir:
-            if not value.is_dir():
-                raise ValidationError(f"'{value}' is not a valid directory", validator=self)
-        if self.is_file:
-            if not value.is_file():
-                raise ValidationError(f"'{value}' is not a valid file", validator=self)
-        if self.exists:
-            if not value.exists():
-                raise ValidationError(f"'{value}' does not exist", validator=self)
+        for check in self._checks:
+            check(value)
+
+    def _check_absolute(self, value: Path) -> None:
+        if not value.is_absolute():
+            raise ValidationError(f"'{value}' is not an absolute path", validator=self)
+
+    def _check_stat(self, value: Path) -> None:
+        # A single stat call answers all three checks instead of one syscall
+        # per Path.is_dir/is_file/exists probe
+        try:
+            st_mode: Optional[int] = stat(value).st_mode
+        except (OSError, ValueError):
+            st_mode = None
+        if self.is_dir and (st_mode is None or not S_ISDIR(st_mode)):
+            raise ValidationError(f"'{value}' is not a valid directory", validator=self)
+        if self.is_file and (st_mode is None or not S_ISREG(st_mode)):
+            raise ValidationError(f"'{value}' is not a valid file", validator=self)
+        if self.exists and st_mode is None:
+            raise ValidationError(f"'{value}' does not exist", validator=self)
 
     def __init__(
         self, is_absolute: bool = False, is_dir: bool = False, is_file: bool = False, exists: bool = False
@@ -147,12 +270,38 @@ class PathValidator(ArgumentValidator[Union[Path, str]]):
         self.is_dir = is_dir
         self.is_file = is_file
         self.exists = exists
+        # Only the checks enabled by the flags run per value - disabled
+        # branches are dropped here instead of being re-tested in validator
+        checks = []
+        if is_absolute:
+            checks.append(self._check_absolute)
+        if is_dir or is_file or exists:
+            checks.append(self._check_stat)
+        self._checks = tuple(checks)
+
+
+# Valid scheme prefix as urlparse recognises it - used by UrlValidator's
+# fast reject below
+_SCHEME_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*\Z")
 
 
 class UrlValidator(ArgumentValidator[str]):
+    __slots__ = ("allowed_schemes", "host_required", "port_required", "_allowed_schemes")
+
     def validator(self, value: str) -> None:
         if not isinstance(value, str):
             raise ValidationError(f"expected 'str' value, found '{type(value).__name__}'", validator=self)
+        if self._allowed_schemes:
+            # Reject a disallowed scheme before paying for the full urlparse;
+            # anything that does not look like a scheme falls through so the
+            # structural error messages stay the same
+            head, sep, _ = value.partition(":")
+            if sep and _SCHEME_RE.match(head) and head.lower() not in self._allowed_schemes:
+                raise ValidationError(
+                    f"invalid scheme {head.lower()}, expected values {self.allowed_schemes}", validator=self
+                )
+        from urllib.parse import urlparse
+
         url_components = urlparse(value)
         rc = validate_url(
             url_components,
@@ -163,47 +312,58 @@ class UrlValidator(ArgumentValidator[str]):
         if rc != "":
             raise ValidationError(rc, validator=self)
 
-    def __init__(self, allowed_schemes: List[str] = [], host_required: bool = False, port_required: bool = False) -> None:
+    def __init__(
+        self, allowed_schemes: Sequence[str] = (), host_required: bool = False, port_required: bool = False
+    ) -> None:
         self.allowed_schemes = allowed_schemes
         self.host_required = host_required
         self.port_required = port_required
+        self._allowed_schemes = frozenset(scheme.lower() for scheme in allowed_schemes)
 
 
 class RegexValidator(ArgumentValidator[str]):
+    __slots__ = ("pattern", "_regex")
+
     def validator(self, value: str) -> None:
         if not isinstance(value, str):
             raise ValidationError(f"expected 'str' value, found '{type(value).__name__}'", validator=self)
 
-        regex = re.compile(self.pattern)
-
-        if not regex.fullmatch(value):
+        if not self._regex.fullmatch(value):
             raise ValidationError(f"'{value}' does not match expression '{self.pattern}'", validator=self)
 
     def __init__(self, pattern: str) -> None:
         self.pattern = pattern
+        # Compile once - validator runs per value, and bad patterns fail fast
+        # at construction instead of on the first value
+        try:
+            self._regex = re.compile(pattern)
+        except re.error as err:
+            raise ValidatorInitError(f"invalid pattern '{pattern}' - {err}", validator=self) from None
 
 
 class ConfirmationValidator(ArgumentValidator[Any]):
+    __slots__ = ("message", "abort_message", "answers", "ignore_case", "_accepted", "_prompt")
+
     def __init__(
         self,
         message: str = "Are you sure you want to proceed?",
         abort_message: str = "aborted!",
-        answers: List[str] = ["y", "yes"],
+        answers: Sequence[str] = ("y", "yes"),
         ignore_case: bool = True,
     ) -> None:
         self.message = message
         self.abort_message = abort_message
         self.answers = answers
         self.ignore_case = ignore_case
+        # Accepted answers normalised once; the prompt string never changes
+        # either, so build it here rather than per prompt
+        self._accepted = frozenset(ans.casefold() for ans in answers) if ignore_case else frozenset(answers)
+        self._prompt = f"{message} [{'/'.join(answers)}]: "
 
     def validator(self, value: str) -> None:
         try:
-            answer = str(input(f"{self.message} [{'/'.join(self.answers)}]: ")).strip()
+            answer = str(input(self._prompt)).strip()
         except KeyboardInterrupt:  # pragma: no cover
             raise ValidationError(self.abort_message, validator=self)
-        if (self.ignore_case and answer.lower() in [ans.lower() for ans in self.answers]) or (
-            not self.ignore_case and answer in self.answers
-        ):
-            pass
-        else:
+        if (answer.casefold() if self.ignore_case else answer) not in self._accepted:
             raise ValidationError(self.abort_message, validator=self)